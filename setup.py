@@ -1,18 +1,18 @@
 import pathlib
 
-import pkg_resources
 from setuptools import setup, find_packages
 
-with pathlib.Path("requirements.txt").open() as requirements_txt:
-    install_requires = [
-        str(requirement)
-        for requirement in pkg_resources.parse_requirements(requirements_txt)
-    ]
+install_requires = [
+    line.strip()
+    for line in pathlib.Path("requirements.txt").read_text().splitlines()
+    if line.strip() and not line.strip().startswith("#")
+]
 
 setup(
     name="Drafts, blueprints & util scripts",
     version="1.0",
     packages=find_packages(),
-    entry_points={},
+    py_modules=["stalker2_sim"],
+    entry_points={"console_scripts": ["stalker2-sim=stalker2_sim:main"]},
     install_requires=install_requires,
 )
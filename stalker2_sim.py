@@ -5,8 +5,21 @@
 Використовує бібліотеку Rich для форматованого виведення таблиць.
 """
 
-import random
+import argparse
+import datetime
+import functools
+import inspect
+import json
+import math
+import os
+import pathlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import requests
+from numba import njit
 from statistics import median
 
 from rich import box
@@ -14,6 +27,9 @@ from rich.console import Console
 from rich.table import Table
 
 
+UNITS_SUFFIXES = ['', 'k', 'M', 'G', 'T', 'P']
+
+
 def units_format(num):
     """
     Форматує число з додаванням суфіксів (k, M, G тощо) для скорочення.
@@ -24,12 +40,26 @@ def units_format(num):
     Повертає:
         str: відформатоване число зі скороченням
     """
-    magnitude = 0
-    while abs(num) >= 1000:
-        magnitude += 1
-        num /= 1000.0
-    # add more suffixes if you need them
-    return '%.3f %s' % (num, ['', 'k', 'M', 'G', 'T', 'P'][magnitude])
+    magnitude = 0 if num == 0 else int(math.log10(abs(num)) // 3)
+    magnitude = min(max(magnitude, 0), len(UNITS_SUFFIXES) - 1)
+    # log10 округлюється вгору біля меж суфіксів (напр. 999999999999999)
+    if magnitude and abs(num) < 1000 ** magnitude:
+        magnitude -= 1
+    return '%.3f %s' % (num / 1000.0 ** magnitude, UNITS_SUFFIXES[magnitude])
+
+
+@functools.lru_cache(maxsize=None)
+def _currency_fmt(length: int):
+    """
+    Повертає закешований метод форматування суми для заданої довжини поля.
+
+    Параметри:
+        length (int): довжина поля для форматованої суми
+
+    Повертає:
+        callable: метод `str.format` для потрібного формату
+    """
+    return (' {:>' + str(length) + ',.0f}').format
 
 
 def currency_format(amount: int, sign="$", length=11):
@@ -39,31 +69,83 @@ def currency_format(amount: int, sign="$", length=11):
     Параметри:
         amount (int): сума грошей для форматування
         sign (str): символ валюти (за замовчуванням "$")
-        length (int): довжина поля для форматованої суми (за замовчуванням 15)
+        length (int): довжина поля для форматованої суми (за замовчуванням 11)
 
     Повертає:
         str: відформатована строка з сумою
     """
-    fmt = ' {:>' + str(length) + ',.0f}'
-    return sign + fmt.format(amount)
+    return sign + _currency_fmt(length)(amount)
+
+
+console = Console()
+MILLION = 1000000
+
+STEAM_APP_ID = '1643320'
+
+# Спільний генератор випадкових чисел (PCG64) для всіх симуляцій
+_RNG = np.random.default_rng()
 
+# Умовні значення для --offline, коли кешу API ще немає (див. `last_cached`).
+# Це не дані з джерела: відгуки Steam і курс USD НБУ лише заповнюють таблицю,
+# а при їх використанні виводиться попередження.
+OFFLINE_REVIEWS = (90000, 20000)
+OFFLINE_EXCHANGE = 41.5
 
 # Джерело: https://steamcommunity.com/groups/steamworks/announcements/detail/1697191267930157838
-def steam_fee(revenue: float) -> float:
+# Пороги загального доходу (USD) та відповідні частки комісії Steam
+STEAM_FEE_TIERS = (
+    (10_000_000, 0.3),  # 30% комісія для доходів менше $10M
+    (50_000_000, 0.25),  # 25% комісія для доходів між $10M і $50M
+    (float('inf'), 0.2),  # 20% комісія для доходів понад $50M
+)
+
+# Дані про продажі за країнами: назва, частка продажів, ціна у гривнях
+# Джерело: https://vginsights.com/game/s-t-a-l-k-e-r-2-heart-of-chornobyl
+# Джерело: https://x.com/VG_Insights/status/1861015666263752993
+COUNTRIES, WEIGHTS, PRICES = zip(*[
+    ('US', 0.229, 2490.52),
+    ('Ukraine', 0.146, 1399.00),
+    ('Germany', 0.081, 2634.46),
+    ('China', 0.081, 1536.40),
+    ('World', 0.463, 1399.00 * 1.5),
+])
+WEIGHTS = np.asarray(WEIGHTS)
+PRICES = np.asarray(PRICES)
+
+if not np.isclose(WEIGHTS.sum(), 1.0):
+    raise ValueError("Сума часток продажів повинна дорівнювати 1")
+
+
+# Компіляція кешується на диску, тож лише перший запуск чекає на JIT
+@njit(cache=True)
+def _accumulate(samples, thresholds, multipliers):
     """
-    Розраховує розмір комісії Steam залежно від загального доходу.
+    Скомпільоване ядро накопичення доходу з урахуванням комісії Steam.
+
+    Комісія монотонно спадає з ростом доходу, тому продажі обробляються
+    окремим циклом для кожного тарифу без розгалуження на кожному продажі.
+    Уся арифметика цілочисельна, суми в копійках.
 
     Параметри:
-        revenue (float): загальний дохід у гривнях
+        samples (np.ndarray): ціни проданих копій у копійках (int64)
+        thresholds (np.ndarray): верхні пороги доходу тарифів Steam у копійках
+            (на один менше, ніж тарифів - останній тариф необмежений)
+        multipliers (np.ndarray): відсоток ціни, що лишається після комісії
 
     Повертає:
-        float: частка комісії Steam
+        tuple[int, int]: загальний дохід та комісія Габену в копійках
     """
-    if revenue / EXCHANGE < 10 * MILLION:
-        return 0.3  # 30% комісія для доходів менше $10M
-    if revenue / EXCHANGE < 50 * MILLION:
-        return 0.25  # 25% комісія для доходів між $10M і $50M
-    return 0.2  # 20% комісія для доходів понад $50M
+    revenue = 0
+    i = 0
+    n = len(samples)
+    for tier in range(len(thresholds)):
+        multiplier = multipliers[tier]
+        while i < n and revenue < thresholds[tier]:
+            revenue += samples[i] * multiplier // 100
+            i += 1
+    # Останній тариф не має верхнього порогу - решта продажів однією сумою
+    revenue += samples[i:].sum() * multipliers[-1] // 100
+    return revenue, samples.sum() - revenue
 
 
 class SalesSimulator:
@@ -72,17 +154,21 @@ class SalesSimulator:
 
     Атрибути:
         total_sales (int): загальна кількість проданих копій
-        sales_by_country (list[tuple[str, float, float]]): дані про частку продажів, ціну за країнами
+        weights (np.ndarray): частки продажів за країнами
+        prices (np.ndarray): ціни за країнами у гривнях
+        exchange (float): курс гривні до долара США
 
     Методи:
-        simulate_sales(chunk_size=1000): симулює продажі з розрахунком доходу
+        simulate_sales(units=None, monte_carlo=False): симулює продажі з розрахунком доходу
     """
 
     def __init__(
         self,
         title: str,
         total_sales: int,
-        market_share_by_country: list[tuple[str, float, float]],
+        weights: np.ndarray,
+        prices: np.ndarray,
+        exchange: float,
     ):
         """
         Ініціалізує симуляцію продажів для заданої гри.
@@ -90,53 +176,102 @@ class SalesSimulator:
         Параметри:
             title (str): назва гри
             total_sales (int): загальна кількість копій для симуляції
-            sales_by_country (list[tuple[str, float, float]]): частки та ціни продажів за країнами
+            weights (np.ndarray): частки продажів за країнами (у сумі 1)
+            prices (np.ndarray): ціни за країнами у гривнях
+            exchange (float): курс гривні до долара США
         """
         self.title = title
         self.total_sales = total_sales
-        self.sales_by_country = market_share_by_country
-
-        self.weights = [share for _, share, _ in market_share_by_country]
-        self.prices = [price for _, _, price in market_share_by_country]
+        self.weights = weights
+        self.prices = prices
+        self.exchange = exchange
 
-        if sum(self.weights) != 1.0:
-            raise ValueError("Сума часток продажів повинна дорівнювати 1")
+        self._mean_price = float(np.dot(self.weights, self.prices))
+        self._prices_cents = np.round(self.prices * 100).astype(np.int64)
+        self._samples = None
 
-    def simulate_sales(self, chunk_size=1000):
+    def simulate_sales(self, units: int | None = None, monte_carlo: bool = False):
         """
         Симулює продажі гри та розраховує дохід.
 
+        За замовчуванням дохід рахується аналітично: при середній ціні продажу
+        очікуваний дохід є кусково-лінійною функцією кількості копій з
+        переломами на порогах комісії Steam.
+
+        У режимі Монте-Карло вибірка продажів генерується один раз на
+        `total_sales` копій, а менші обсяги рахуються по її префіксу.
+        Накопичення доходу в копійках (int64) виконується скомпільованим
+        ядром `_accumulate` (Numba).
+
         Параметри:
-            chunk_size (int): розмір блоку продажів для моделювання
+            units (int | None): кількість копій, не більша за `total_sales`
+                (за замовчуванням `total_sales`)
+            monte_carlo (bool): використати симуляцію Монте-Карло замість
+                аналітичного розрахунку
 
         Повертає:
             tuple[float, float]: загальний дохід у гривнях та комісія Габену
+                (у режимі Монте-Карло - цілі гривні, int)
         """
-        revenue = 0.0
-        gaben_revenue = 0.0
+        units = self.total_sales if units is None else units
+        if units > self.total_sales:
+            raise ValueError("Кількість копій не може перевищувати розмір симуляції")
+
+        if not monte_carlo:
+            revenue = 0.0
+            remaining = int(units)
+            for threshold_usd, fee in STEAM_FEE_TIERS:
+                sale = self._mean_price * (1 - fee)
+                # Кількість продажів, доки дохід не досягне порогу тарифу
+                tier_sales = remaining
+                if threshold_usd != float('inf'):
+                    needed = math.ceil((threshold_usd * self.exchange - revenue) / sale)
+                    tier_sales = min(remaining, max(needed, 0))
+                revenue += tier_sales * sale
+                remaining -= tier_sales
+            return revenue, int(units) * self._mean_price - revenue
+
+        thresholds = np.array(
+            [round(usd * self.exchange * 100) for usd, _ in STEAM_FEE_TIERS[:-1]],
+            dtype=np.int64,
+        )
+        multipliers = np.array(
+            [round((1 - fee) * 100) for _, fee in STEAM_FEE_TIERS], dtype=np.int64
+        )
 
-        with console.status('[bold orange3]Симуляція продажів ...', spinner='dots2'):
-            for i in range(int(self.total_sales / chunk_size)):
-                for sale in random.choices(self.prices, self.weights, k=chunk_size):
-                    revenue += sale * (1 - steam_fee(revenue))
-                    gaben_revenue += sale * steam_fee(revenue)
+        if self._samples is None:
+            # Кількість продажів за країнами одним мультиноміальним розподілом,
+            # перемішування задає порядок продажів для переходу між тарифами
+            counts = _RNG.multinomial(int(self.total_sales), self.weights)
+            self._samples = np.repeat(self._prices_cents, counts)
+            _RNG.shuffle(self._samples)
+        revenue_cents, gaben_cents = _accumulate(
+            self._samples[:int(units)], thresholds, multipliers
+        )
 
-        return revenue, gaben_revenue
+        return int(revenue_cents) // 100, int(gaben_cents) // 100
 
 
 def calculate_profit(
     estimates: list[tuple[str, int]],
-    sales: list[tuple[str, float, float]],
+    weights: np.ndarray,
+    prices: np.ndarray,
     budget: list[tuple[str, int]],
-    show_gaben: bool = False
+    exchange: float,
+    show_gaben: bool = False,
+    monte_carlo: bool = False,
 ):
     """
     Розраховує та виводить прибуток за оцінками кількості користувачів.
 
     Параметри:
         estimates (list[tuple[str, int]]): джерела оцінок та кількість користувачів
-        sales (list[tuple[str, float, float]]): дані про продажі (країна, частка, ціна)
+        weights (np.ndarray): частки продажів за країнами
+        prices (np.ndarray): ціни за країнами у гривнях
         budget (list[tuple[str, int]]): оцінки б'юджету гри
+        exchange (float): курс гривні до долара США
+        show_gaben (bool): показати комісію Steam окремою колонкою
+        monte_carlo (bool): рахувати дохід симуляцією Монте-Карло
     """
     sim_table = Table(
         title='[bold bright_white]Stalker 2[/] розрахунок прибутку',
@@ -171,53 +306,68 @@ def calculate_profit(
 
     estimates.sort(key=lambda e: e[1])
 
-    for source, units in estimates:
-        sales_sim = SalesSimulator(source, units, sales)
-        revenue_uah, revenue_gaben = sales_sim.simulate_sales()
-
-        profit_uah = int(revenue_uah)
-        profit_usd = int(revenue_uah / EXCHANGE)
-
-        # Вивід результатів
-        renderables=[
-            source,
-            f'{units_format(units)}',
-            currency_format(profit_uah, sign='₴'),
-            currency_format(profit_usd, sign='$'),
+    with console.status('[bold orange3]Симуляція продажів ...', spinner='dots2'):
+        # Одна вибірка на максимальну кількість копій для всіх оцінок
+        units_sold = [units for _, units in estimates]
+        sales_sim = SalesSimulator(
+            'Stalker 2', max(units_sold), weights, prices, exchange
+        )
+        statistics = [
+            ('Мінімум', min(units_sold)),
+            ('Медіана', median(units_sold)),
+            ('Максимум', max(units_sold)),
         ]
-        if show_gaben:
-            renderables.append(
-                currency_format(int(revenue_gaben / EXCHANGE), sign='$')
-            )
-        sim_table.add_row(*renderables)
 
-    sim_table.add_section()
-
-    # Статистичні розрахунки
-    units_sold = [units for _, units in estimates]
-    for source, units in [
-        ('Мінімум', min(units_sold)),
-        ('Медіана', median(units_sold)),
-        ('Максимум', max(units_sold)),
-    ]:
-        sales_sim = SalesSimulator(source, units, sales)
-        revenue_uah, revenue_gaben  = sales_sim.simulate_sales()
-
-        profit_uah  = int(revenue_uah)
-        profit_usd = int(revenue_uah / EXCHANGE)
-
-        # Вивід результатів
-        renderables = [
-            f'[i bold]{source}[/]',
-            f'[i bold]{units_format(units)}[/]',
-            f'[i bold]{currency_format(profit_uah, sign="₴")}[/]',
-            f'[i bold]{currency_format(profit_usd, sign="$")}[/]',
+        results = [
+            sales_sim.simulate_sales(units, monte_carlo)
+            for _, units in estimates + statistics
         ]
-        if show_gaben:
-            renderables.append(
-                f'[i bold]{currency_format(int(revenue_gaben / EXCHANGE), sign="$")}[/]',
-            )
 
+        rows: list[list[str]] = []
+        for (source, units), (revenue_uah, revenue_gaben) in zip(estimates, results):
+            profit_uah = int(revenue_uah)
+            profit_usd = int(revenue_uah / exchange)
+
+            # Вивід результатів
+            renderables=[
+                source,
+                f'{units_format(units)}',
+                currency_format(profit_uah, sign='₴'),
+                currency_format(profit_usd, sign='$'),
+            ]
+            if show_gaben:
+                renderables.append(
+                    currency_format(int(revenue_gaben / exchange), sign='$')
+                )
+            rows.append(renderables)
+
+        # Статистичні розрахунки
+        statistic_rows: list[list[str]] = []
+        for (source, units), (revenue_uah, revenue_gaben) in zip(
+            statistics, results[len(estimates):]
+        ):
+            profit_uah  = int(revenue_uah)
+            profit_usd = int(revenue_uah / exchange)
+
+            # Вивід результатів
+            renderables = [
+                f'[i bold]{source}[/]',
+                f'[i bold]{units_format(units)}[/]',
+                f'[i bold]{currency_format(profit_uah, sign="₴")}[/]',
+                f'[i bold]{currency_format(profit_usd, sign="$")}[/]',
+            ]
+            if show_gaben:
+                renderables.append(
+                    f'[i bold]{currency_format(int(revenue_gaben / exchange), sign="$")}[/]',
+                )
+
+            statistic_rows.append(renderables)
+
+    # Рядки додаються до таблиці одним проходом після всіх розрахунків
+    for renderables in rows:
+        sim_table.add_row(*renderables)
+    sim_table.add_section()
+    for renderables in statistic_rows:
         sim_table.add_row(*renderables)
 
     console.print(sim_table)
@@ -240,6 +390,142 @@ def calculate_profit(
     console.print(budget_table)
 
 
+# Кеш відповідей API на поточну добу
+CACHE_PATH = pathlib.Path('~/.cache/stalker2_sim.json').expanduser()
+_CACHE_LOCK = threading.Lock()
+_SESSION = requests.Session()
+
+
+def daily_cache(func):
+    """
+    Кешує результат функції в пам'яті та у файлі `CACHE_PATH` до кінця доби.
+
+    Ключ кешу будується з аргументів, прив'язаних до сигнатури функції разом
+    зі значеннями за замовчуванням, тож `f('USD')`, `f(cur_val='USD')` і `f()`
+    мають спільний запис.
+
+    Параметри:
+        func (callable): функція з JSON-серіалізованим результатом
+            (списки та кортежі повертаються як кортежі)
+
+    Повертає:
+        callable: обгорнута функція
+    """
+    signature = inspect.signature(func)
+
+    @functools.lru_cache(maxsize=None)
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = _cache_key(func, bound.arguments)
+        today = datetime.date.today().isoformat()
+
+        with _CACHE_LOCK:
+            cache = _read_cache(today)
+        if key in cache:
+            return _from_json(cache[key])
+
+        result = _from_json(func(*args, **kwargs))
+        with _CACHE_LOCK:
+            cache = _read_cache(today)
+            cache[key] = result
+            _write_cache(cache)
+        return result
+
+    return wrapper
+
+
+def _cache_key(func, arguments: dict) -> str:
+    """
+    Будує ключ файлового кешу для виклику функції.
+
+    Параметри:
+        func (callable): закешована функція
+        arguments (dict): аргументи виклику за назвами параметрів
+
+    Повертає:
+        str: ключ запису в кеші
+    """
+    return func.__name__ + json.dumps(arguments, sort_keys=True)
+
+
+def _from_json(value):
+    """
+    Приводить значення до типу, що однаковий до і після збереження в JSON.
+
+    Параметри:
+        value: результат функції або значення з кешу
+
+    Повертає:
+        значення, де списки замінено на кортежі
+    """
+    return tuple(value) if isinstance(value, (list, tuple)) else value
+
+
+def _write_cache(cache: dict):
+    """
+    Атомарно записує файловий кеш через тимчасовий файл і `os.replace`.
+
+    Параметри:
+        cache (dict): закешовані результати за ключем виклику
+    """
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        'w', dir=CACHE_PATH.parent, suffix='.tmp', delete=False
+    ) as tmp:
+        json.dump(cache, tmp)
+    os.replace(tmp.name, CACHE_PATH)
+
+
+def _load_cache() -> dict:
+    """
+    Зчитує файловий кеш без перевірки дати.
+
+    Повертає:
+        dict: вміст кешу або порожній словник, якщо файлу немає чи він пошкоджений
+    """
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _read_cache(today: str) -> dict:
+    """
+    Зчитує файловий кеш, відкидаючи записи за попередні дні.
+
+    Параметри:
+        today (str): поточна дата у форматі ISO
+
+    Повертає:
+        dict: закешовані результати за ключем виклику
+    """
+    cache = _load_cache()
+    return cache if cache.get('date') == today else {'date': today}
+
+
+def last_cached(func, *args, **kwargs):
+    """
+    Повертає останній збережений результат виклику незалежно від дати кешу.
+
+    Параметри:
+        func (callable): функція, обгорнута `daily_cache`
+        *args, **kwargs: аргументи виклику
+
+    Повертає:
+        tuple | None: результат і дата запису в кеші, або None, якщо запису немає
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    cache = _load_cache()
+    key = _cache_key(func, bound.arguments)
+    if key not in cache:
+        return None
+    return _from_json(cache[key]), cache.get('date')
+
+
+@daily_cache
 def get_steam_reviews(app_id: str):
     """
     Отримує кількість відгуків з Steam API для вказаного додатку
@@ -251,13 +537,14 @@ def get_steam_reviews(app_id: str):
         tuple[int, int]: кількість позитивних та негативних відгуків
     """
     api_url = f"https://store.steampowered.com/appreviews/{app_id}?json=1&language=all&purchase_type=all"
-    reviews = requests.get(api_url).json()
+    reviews = _SESSION.get(api_url).json()
     return (
         reviews['query_summary']['total_positive'],
         reviews['query_summary']['total_negative'],
     )
 
 
+@daily_cache
 def get_exchange_rate(cur_val: str = "USD"):
     """
     Отримання курсу валют з API Національного банку України.
@@ -271,7 +558,7 @@ def get_exchange_rate(cur_val: str = "USD"):
     :raises ValueError: Помилка при отримання валютного курсу.
     """
     url = f'https://bank.gov.ua/NBUStatService/v1/statdirectory/exchange?json&valcode={cur_val}'
-    response = requests.get(url)
+    response = _SESSION.get(url)
 
     if response.status_code == 200:
         return float(response.json()[0]['rate'])
@@ -281,23 +568,46 @@ def get_exchange_rate(cur_val: str = "USD"):
         )
 
 
-if __name__ == '__main__':
-    console = Console()
-    MILLION = 1000000
-
-    # Дані про продажі за країнами
-    # Джерело: https://vginsights.com/game/s-t-a-l-k-e-r-2-heart-of-chornobyl
-    # Джерело: https://x.com/VG_Insights/status/1861015666263752993
-    SALES_BY_COUNTRY = [
-        ('US', 0.229, 2490.52),
-        ('Ukraine', 0.146, 1399.00),
-        ('Germany', 0.081, 2634.46),
-        ('China', 0.081, 1536.40),
-        ('World', 0.463, 1399.00 * 1.5),
-    ]
-
-    STEAM_APP_ID = '1643320'
-    REVIEWS_P, REVIEWS_N = get_steam_reviews(STEAM_APP_ID)
+def main():
+    """
+    Точка входу: отримує дані з API (або офлайн-значення) та виводить таблиці.
+    """
+    parser = argparse.ArgumentParser(
+        description='Приблизна оцінка прибутків гри Stalker 2'
+    )
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='не звертатись до API, використати останні значення з кешу',
+    )
+    parser.add_argument(
+        '--monte-carlo',
+        action='store_true',
+        help='рахувати дохід симуляцією Монте-Карло',
+    )
+    args = parser.parse_args()
+
+    if args.offline:
+        cached_reviews = last_cached(get_steam_reviews, STEAM_APP_ID)
+        cached_exchange = last_cached(get_exchange_rate, cur_val='USD')
+        if cached_reviews and cached_exchange:
+            (REVIEWS_P, REVIEWS_N), cache_date = cached_reviews
+            exchange_rate, _ = cached_exchange
+            console.print(f'* офлайн: відгуки та курс з кешу API за [blue]{cache_date}[/]')
+        else:
+            REVIEWS_P, REVIEWS_N = OFFLINE_REVIEWS
+            exchange_rate = OFFLINE_EXCHANGE
+            console.print(
+                '[bold yellow]* офлайн: кешу API немає, відгуки та курс - '
+                'умовні значення, а не реальні дані[/]'
+            )
+    else:
+        # Отримати відгуки Steam і курс обміну з API Національного банку України паралельно
+        with ThreadPoolExecutor(2) as executor:
+            reviews = executor.submit(get_steam_reviews, STEAM_APP_ID)
+            exchange = executor.submit(get_exchange_rate, cur_val='USD')
+            REVIEWS_P, REVIEWS_N = reviews.result()
+            exchange_rate = exchange.result()
 
     ESTIMATES_BY_TRACKERS = [
         ('PlayTracker', int(0.889 * MILLION)),
@@ -315,9 +625,6 @@ if __name__ == '__main__':
         ('Максимальний б\'юджет', 100 * MILLION),
     ]
 
-    # Отримати курс обміну динамічно з API Національного банку України
-    EXCHANGE = get_exchange_rate(cur_val='USD')
-
     # Розрахунок прибутків для заданих оцінок і продажів
     console.print(
         '[bold bright_white]Stalker 2[/] розрахунок прибутку по інформації з різних джерел'
@@ -328,4 +635,15 @@ if __name__ == '__main__':
         f'негативні [red]{REVIEWS_N}[/] = '
         f'оцінка [yellow]{REVIEWS_P / (REVIEWS_P + REVIEWS_N) * 100:.2f}[/]'
     )
-    calculate_profit(ESTIMATES_BY_TRACKERS, SALES_BY_COUNTRY, BUDGET)
+    calculate_profit(
+        ESTIMATES_BY_TRACKERS,
+        WEIGHTS,
+        PRICES,
+        BUDGET,
+        exchange_rate,
+        monte_carlo=args.monte_carlo,
+    )
+
+
+if __name__ == '__main__':
+    main()